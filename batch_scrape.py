@@ -3,29 +3,112 @@
 Batch Cheese Scraper
 Scrape multiple cheeses from cheese.com
 
+Setup:
+  pip install -r requirements.txt
+  (the httpx[http2] extra is required for HTTP/2 support)
+
 Usage:
   python3 batch_scrape.py <url1> <url2> <url3> ...
   python3 batch_scrape.py --file urls.txt
   python3 batch_scrape.py --output cheeses.json <url1> <url2>
 """
 
+import os
 import sys
-import json
 import time
-import random
+import asyncio
+import hashlib
+import argparse
+import functools
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-from urllib.request import Request, urlopen
-from urllib.error import URLError, HTTPError
-from html.parser import HTMLParser
+import httpx
+import orjson
+import ahocorasick
+from selectolax.parser import HTMLParser
 import re
 
 
-class CheeseParser(HTMLParser):
-    """Parse cheese.com HTML pages"""
-    
-    def __init__(self, url=''):
-        super().__init__()
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+# How many requests may be in flight at once
+MAX_CONCURRENCY = 8
+
+# Fetched pages are cached here so re-runs skip the network entirely
+CACHE_DIR = Path('.cache')
+CACHE_MAX_AGE_DAYS = 7
+
+# All labelled fields fused into one alternation so a single finditer pass
+# over the panel text captures every label, instead of one scan per field;
+# exactly one named group matches per hit, exposed via match.lastgroup.
+# Each value stops before the next label (lookahead): flattened panel text
+# often has no newlines between fields, and a greedy value would swallow
+# the following labels so finditer never saw them
+_FIELD_LABELS = r'Country of origin:|Texture:|Type:|Colou?r:|Rind:|Flavou?r:'
+_FIELD_VALUE = r'[^\n•]+?(?=\s*(?:' + _FIELD_LABELS + r')|[\n•]|$)'
+_RE_FIELDS = re.compile(
+    r'Country of origin:\s*(?P<country>' + _FIELD_VALUE + r')'
+    r'|Texture:\s*(?P<texture>' + _FIELD_VALUE + r')'
+    r'|Type:\s*(?P<type>' + _FIELD_VALUE + r')'
+    r'|Colou?r:\s*(?P<color>' + _FIELD_VALUE + r')'
+    r'|Rind:\s*(?P<rind>\w+)'
+    r'|Flavou?r:\s*(?P<flavor>' + _FIELD_VALUE + r')',
+    re.IGNORECASE)
+# "aged for N ..." is prose, so it scans the description text, not the panel
+_RE_AGED_FOR = re.compile(r'aged?\s+for\s+\d+', re.IGNORECASE)
+# One Aho-Corasick pass over the lowercased text collects every keyword flag
+# the heuristics below need, instead of a separate O(N) scan per keyword
+_KEYWORDS = ('blue', 'vein', 'sharp', 'strong', 'bloomy', 'washed', 'rind', 'fresh', 'unaged')
+_KEYWORD_AUTOMATON = ahocorasick.Automaton()
+for _keyword in _KEYWORDS:
+    _KEYWORD_AUTOMATON.add_word(_keyword, _keyword)
+_KEYWORD_AUTOMATON.make_automaton()
+# Single alternation so milk detection scans the text once: branch <a> covers
+# "Made from/from/using/with [modifiers] [animal]'s milk" (allow space before
+# apostrophe), branch <b> bare "[animal]'s milk" not preceded by "by"
+_RE_MILK = re.compile(
+    r'(?:Made from|from|using|with)\s+'
+    r'(?:pasteurized\s+|raw\s+|unpasteurized\s+|organic\s+|fresh\s+)*'
+    r'(?P<a>\w+)\s*(?:\'s|s)?\s+milk'
+    r'|(?<!by\s)(?P<b>\w+)\s*\'s\s+milk',
+    re.IGNORECASE)
+# Skip common false positives
+_MILK_STOPWORDS = {'by', 'the', 'a', 'an', 'this', 'that', 'made', 'from', 'with'}
+_MILK_MAP = {
+    'cow': 'Cow',
+    'goat': 'Goat',
+    'sheep': 'Sheep',
+    'ewe': 'Sheep',
+    'buffalo': 'Buffalo',
+    'water': 'Buffalo',
+}
+_RE_CLEAN_SPLIT = re.compile(r'Type:|Texture:|Rind:|Flavou?r:')
+
+
+@functools.lru_cache(maxsize=4096)
+def _clean_text_cached(text):
+    text = ' '.join(text.split())
+    return _RE_CLEAN_SPLIT.split(text)[0].strip()
+
+
+def _clean_text(text):
+    """Collapse whitespace and cut the value at the next field label"""
+    # Field values (country names, texture categories) recur across pages,
+    # so short inputs are memoized; long paragraphs bypass the cache to keep
+    # its memory bounded
+    if len(text) < 256:
+        return _clean_text_cached(text)
+    return _clean_text_cached.__wrapped__(text)
+
+
+class CheeseParser:
+    """Parse cheese.com HTML pages via selectolax CSS selectors"""
+
+    def __init__(self, html, url=''):
+        self.tree = HTMLParser(html)
         self.url = url
         self.data = {
             'name': '',
@@ -40,87 +123,72 @@ class CheeseParser(HTMLParser):
             'description': '',
             'url': url
         }
-        self.in_h1 = False
-        self.in_description = False
-        self.description_paragraphs = []
-        self.text_content = []
-        
-    def handle_starttag(self, tag, attrs):
-        attrs_dict = dict(attrs)
-        
-        if tag == 'h1':
-            self.in_h1 = True
-        
-        if tag == 'img' and not self.data['image']:
-            src = attrs_dict.get('src', '')
+
+    def extract_data(self):
+        tree = self.tree
+
+        # Name
+        h1 = tree.css_first('h1')
+        if h1:
+            self.data['name'] = h1.text(strip=True)
+
+        # Image
+        for img in tree.css('img'):
+            src = img.attributes.get('src') or ''
             # Match both /media/img/cheese/ and /media/img/cheese-suggestion/
             if '/media/img/cheese' in src:
                 if src.startswith('/'):
                     self.data['image'] = f"https://www.cheese.com{src}"
                 else:
                     self.data['image'] = src
-        
-        if tag == 'div' and attrs_dict.get('id') == 'collapse-description':
-            self.in_description = True
-        
-        if tag == 'p' and self.in_description:
-            self.description_paragraphs.append('')
-    
-    def handle_endtag(self, tag):
-        if tag == 'h1':
-            self.in_h1 = False
-        if tag == 'div':
-            self.in_description = False
-    
-    def handle_data(self, data):
-        if self.in_h1:
-            self.data['name'] = data.strip()
-        
-        if self.in_description and self.description_paragraphs:
-            self.description_paragraphs[-1] += data
-        
-        self.text_content.append(data)
-    
-    def extract_data(self):
-        full_text = ' '.join(self.text_content)
-        
-        # Country
-        country_match = re.search(r'Country of origin:\s*([^\n•]+)', full_text, re.IGNORECASE)
-        if country_match:
-            self.data['country'] = self._clean_text(country_match.group(1))
-        
-        # Milk - FIXED: Better pattern to handle spacing issues
-        milk_patterns = [
-            # Pattern 1: "Made from [modifiers] [animal]'s milk" - allow space before apostrophe
-            r'Made from\s+(?:pasteurized\s+|raw\s+|unpasteurized\s+|organic\s+|fresh\s+)*(\w+)\s*(?:\'s|\'s|s)?\s+milk',
-            # Pattern 2: More flexible, but avoid "by"
-            r'(?:from|using|with)\s+(?:pasteurized\s+|raw\s+|unpasteurized\s+|organic\s+|fresh\s+)*(\w+)\s*(?:\'s|\'s|s)?\s+milk',
-            # Pattern 3: Just "[animal]'s milk" but not preceded by "by"
-            r'(?<!by\s)(\w+)\s*(?:\'s|\'s)\s+milk',
-        ]
-        for pattern in milk_patterns:
-            milk_match = re.search(pattern, full_text, re.IGNORECASE)
-            if milk_match:
-                milk_type = milk_match.group(1).lower()
-                # Skip common false positives
-                if milk_type in ['by', 'the', 'a', 'an', 'this', 'that', 'made', 'from', 'with']:
-                    continue
-                if 'cow' in milk_type:
-                    self.data['milk'] = 'Cow'
-                elif 'goat' in milk_type:
-                    self.data['milk'] = 'Goat'
-                elif 'sheep' in milk_type or 'ewe' in milk_type:
-                    self.data['milk'] = 'Sheep'
-                elif 'buffalo' in milk_type or 'water' in milk_type:
-                    self.data['milk'] = 'Buffalo'
-                else:
-                    self.data['milk'] = milk_type.title()
                 break
-        
+
+        # Description paragraphs
+        description_div = tree.css_first('#collapse-description')
+        description_paragraphs = [p.text() for p in description_div.css('p')] if description_div else []
+
+        # Only flatten the nodes the extraction actually reads: the summary
+        # panel for the labelled fields, the description for keyword cues.
+        # Flattening the whole body would drag navigation and footer text
+        # into every scan; it stays as a fallback when the panel is missing.
+        summary = tree.css_first('.summary_points')
+        if summary is not None:
+            info_text = summary.text(separator=' ')
+        else:
+            body = tree.body
+            info_text = body.text(separator=' ') if body is not None else ''
+        description_text = description_div.text(separator=' ') if description_div else ''
+        relevant_text = f'{info_text} {description_text}'.lower()
+        keywords = {keyword for _, keyword in _KEYWORD_AUTOMATON.iter(relevant_text)}
+
+        # All labelled fields in one pass, keeping the first hit per label
+        fields = {}
+        for match in _RE_FIELDS.finditer(info_text):
+            label = match.lastgroup
+            if label not in fields:
+                fields[label] = match.group(label)
+
+        # Country
+        if 'country' in fields:
+            self.data['country'] = _clean_text(fields['country'])
+
+        # Milk - keep scanning past stopword hits so one bad leading phrase
+        # (e.g. "with the milk of...") can't kill detection for the page
+        for milk_match in _RE_MILK.finditer(info_text):
+            milk_type = (milk_match.group('a') or milk_match.group('b')).lower()
+            if milk_type in _MILK_STOPWORDS:
+                continue
+            for animal, label in _MILK_MAP.items():
+                if animal in milk_type:
+                    self.data['milk'] = label
+                    break
+            else:
+                self.data['milk'] = milk_type.title()
+            break
+
         # Texture
-        texture_match = re.search(r'Texture:\s*([^\n•]+)', full_text, re.IGNORECASE)
-        if texture_match:
-            texture_text = texture_match.group(1).lower()
+        if 'texture' in fields:
+            texture_text = fields['texture'].lower()
             if 'crumbly' in texture_text:
                 self.data['texture'] = 'Crumbly'
             elif 'firm' in texture_text:
@@ -132,219 +200,278 @@ class CheeseParser(HTMLParser):
             elif 'creamy' in texture_text:
                 self.data['texture'] = 'Creamy'
             else:
-                self.data['texture'] = self._clean_text(texture_text).split()[0].title()
-        
-        if not self.data['texture']:
-            type_match = re.search(r'Type:\s*([^\n•]+)', full_text, re.IGNORECASE)
-            if type_match:
-                type_text = type_match.group(1).lower()
-                if 'hard' in type_text:
-                    self.data['texture'] = 'Hard'
-                elif 'semi-hard' in type_text:
-                    self.data['texture'] = 'Semi-hard'
-                elif 'semi-soft' in type_text:
-                    self.data['texture'] = 'Semi-soft'
-                elif 'soft' in type_text:
-                    self.data['texture'] = 'Soft'
-        
+                self.data['texture'] = _clean_text(texture_text).split()[0].title()
+
+        if not self.data['texture'] and 'type' in fields:
+            type_text = fields['type'].lower()
+            if 'hard' in type_text:
+                self.data['texture'] = 'Hard'
+            elif 'semi-hard' in type_text:
+                self.data['texture'] = 'Semi-hard'
+            elif 'semi-soft' in type_text:
+                self.data['texture'] = 'Semi-soft'
+            elif 'soft' in type_text:
+                self.data['texture'] = 'Soft'
+
         # Color
-        color_match = re.search(r'Colou?r:\s*([^\n•]+)', full_text, re.IGNORECASE)
-        if color_match:
-            self.data['color'] = self._clean_text(color_match.group(1)).title()
+        if 'color' in fields:
+            self.data['color'] = _clean_text(fields['color']).title()
         else:
-            if 'blue' in full_text.lower() and 'vein' in full_text.lower():
+            if 'blue' in keywords and 'vein' in keywords:
                 self.data['color'] = 'Blue-Veined'
             else:
                 self.data['color'] = 'Yellow'
-        
+
         # Aged - FIX: safely get texture value
         texture = self.data.get('texture') or ''
         texture_lower = texture.lower()
-        
+
         if texture_lower in ['hard', 'semi-hard', 'firm']:
             self.data['aged'] = 'Yes'
         elif texture_lower in ['soft', 'creamy', 'fresh']:
             self.data['aged'] = 'No'
-        
-        if re.search(r'aged?\s+for\s+\d+', full_text, re.IGNORECASE):
+
+        if _RE_AGED_FOR.search(relevant_text):
             self.data['aged'] = 'Yes'
-        if re.search(r'fresh|unaged', full_text, re.IGNORECASE):
+        if keywords & {'fresh', 'unaged'}:
             self.data['aged'] = 'No'
-        
+
         # Rind
-        rind_match = re.search(r'Rind:\s*(\w+)', full_text, re.IGNORECASE)
-        if rind_match:
-            self.data['rind'] = self._clean_text(rind_match.group(1)).title()
-        elif 'bloomy' in full_text.lower():
+        if 'rind' in fields:
+            self.data['rind'] = _clean_text(fields['rind']).title()
+        elif 'bloomy' in keywords:
             self.data['rind'] = 'Bloomy'
-        elif 'washed' in full_text.lower() and 'rind' in full_text.lower():
+        elif 'washed' in keywords and 'rind' in keywords:
             self.data['rind'] = 'Washed'
-        
+
         # Flavor
-        flavor_match = re.search(r'Flavou?r:\s*([^\n•]+)', full_text, re.IGNORECASE)
-        if flavor_match:
-            flavor_text = self._clean_text(flavor_match.group(1))
+        if 'flavor' in fields:
+            flavor_text = _clean_text(fields['flavor'])
             self.data['flavor'] = flavor_text.split('and')[0].split(',')[0].strip().title()
-        elif 'sharp' in full_text.lower():
+        elif 'sharp' in keywords:
             self.data['flavor'] = 'Sharp'
-        elif 'strong' in full_text.lower():
+        elif 'strong' in keywords:
             self.data['flavor'] = 'Strong'
-        
+
         # Description
-        if self.description_paragraphs:
-            for para in self.description_paragraphs:
-                cleaned = self._clean_text(para)
+        if description_paragraphs:
+            for para in description_paragraphs:
+                cleaned = _clean_text(para)
                 if len(cleaned) > 50:
                     self.data['description'] = cleaned[:200] + '...' if len(cleaned) > 200 else cleaned
                     break
-        
+
         return self.data
-    
-    def _clean_text(self, text):
-        text = ' '.join(text.split())
-        text = re.split(r'Type:|Texture:|Rind:|Flavou?r:', text)[0]
-        return text.strip()
-
-
-def fetch_url(url, max_retries=3):
-    """Fetch URL content with retry logic"""
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
-    
+
+
+class RateLimiter:
+    """Token-bucket pacing for polite scraping.
+
+    Each waiter reserves the next slot on a shared schedule, so the average
+    request rate matches the configured delay while requests still overlap
+    (unlike a per-request sleep, which serializes the whole batch).
+    """
+
+    def __init__(self, rate):
+        self.rate = rate
+        self._next = 0.0
+
+    async def wait(self):
+        now = asyncio.get_running_loop().time()
+        self._next = max(now, self._next) + 1.0 / self.rate
+        await asyncio.sleep(self._next - now)
+
+
+class ResultWriter:
+    """Write results incrementally so the whole batch never sits in memory.
+
+    Writes JSON Lines when the output filename ends in .jsonl, otherwise a
+    JSON array built element by element (to the file or stdout).
+    """
+
+    def __init__(self, output_file=None):
+        self.output_file = output_file
+        self.jsonl = bool(output_file) and output_file.endswith('.jsonl')
+        self.count = 0
+        self._fh = open(output_file, 'wb') if output_file else sys.stdout.buffer
+        if not self.jsonl:
+            self._fh.write(b'[')
+
+    def write(self, cheese):
+        if self.jsonl:
+            self._fh.write(orjson.dumps(cheese) + b'\n')
+        else:
+            if self.count:
+                self._fh.write(b',')
+            self._fh.write(b'\n' + orjson.dumps(cheese, option=orjson.OPT_INDENT_2))
+        self.count += 1
+        self._fh.flush()
+
+    def close(self):
+        if not self.jsonl:
+            self._fh.write(b'\n]\n' if self.count else b']\n')
+        if self._fh is not sys.stdout.buffer:
+            self._fh.close()
+
+
+def _parse_html(html, url):
+    """Parse a fetched page into a cheese dict (pickleable, runs in a worker process)"""
+    return CheeseParser(html, url).extract_data()
+
+
+def _cache_path(url):
+    key = hashlib.sha1(url.encode()).hexdigest()
+    return CACHE_DIR / key[:2] / key
+
+
+async def fetch_url(client, url, sem, limiter, max_retries=3, use_cache=True):
+    """Fetch raw page bytes with retry logic, consulting the disk cache first"""
+    cache_path = _cache_path(url) if use_cache else None
+    if cache_path is not None:
+        try:
+            if time.time() - cache_path.stat().st_mtime < CACHE_MAX_AGE_DAYS * 86400:
+                return cache_path.read_bytes()
+        except OSError:
+            pass
+
+    # Be polite - reserve a slot on the shared schedule so the average
+    # request rate stays bounded (cache hits above skip both the wait and
+    # the network)
+    await limiter.wait()
+
     for attempt in range(max_retries):
         try:
-            request = Request(url, headers=headers)
-            with urlopen(request, timeout=30) as response:
-                return response.read().decode('utf-8')
-        except (URLError, HTTPError) as e:
+            async with sem:
+                response = await client.get(url)
+                response.raise_for_status()
+                # Raw bytes: selectolax decodes during tokenization, so
+                # there's no need for an intermediate str copy of the page
+                html = response.content
+                if cache_path is not None:
+                    # Write via a temp file so a crash never leaves a
+                    # truncated cache entry
+                    cache_path.parent.mkdir(parents=True, exist_ok=True)
+                    tmp_path = cache_path.with_suffix('.tmp')
+                    tmp_path.write_bytes(html)
+                    tmp_path.replace(cache_path)
+                return html
+        except httpx.HTTPError as e:
             if attempt < max_retries - 1:
                 # Exponential backoff: 2s, 4s, 8s
                 wait_time = 2 ** (attempt + 1)
                 print(f"  ⚠ Error (attempt {attempt + 1}/{max_retries}): {e}", file=sys.stderr)
                 print(f"  ⏳ Waiting {wait_time}s before retry...", file=sys.stderr)
-                time.sleep(wait_time)
+                await asyncio.sleep(wait_time)
             else:
                 print(f"  ✗ Failed after {max_retries} attempts: {e}", file=sys.stderr)
                 return None
         except Exception as e:
             print(f"  ✗ Unexpected error: {e}", file=sys.stderr)
             return None
-    
+
     return None
 
 
-def scrape_cheese(url):
+async def scrape_cheese(client, url, sem, pool, limiter, use_cache=True):
     """Scrape single cheese"""
     if not url.startswith('https://www.cheese.com/'):
         print(f"Skipping invalid URL: {url}", file=sys.stderr)
         return None
-    
-    html = fetch_url(url)
+
+    html = await fetch_url(client, url, sem, limiter, use_cache=use_cache)
     if not html:
         return None
-    
-    parser = CheeseParser(url)
-    parser.feed(html)
-    cheese_data = parser.extract_data()
-    
+
+    # Parsing is CPU-bound; run it in the process pool so it doesn't
+    # block the event loop
+    loop = asyncio.get_running_loop()
+    cheese_data = await loop.run_in_executor(pool, _parse_html, html, url)
+
     # Only return if we have essential data
     if cheese_data.get('name') and cheese_data.get('country') and cheese_data.get('milk'):
+        print(f"  ✓ {cheese_data['name']}", file=sys.stderr)
         return cheese_data
-    
+
+    print(f"  ✗ Failed or incomplete data: {url}", file=sys.stderr)
     return None
 
 
+async def main_async(urls, min_delay, max_delay, writer, use_cache=True):
+    """Scrape all URLs concurrently, streaming each result to the writer"""
+    sem = asyncio.Semaphore(MAX_CONCURRENCY)
+    # Same average rate the old per-request sleep targeted, but enforced
+    # globally so in-flight requests overlap
+    limiter = RateLimiter(rate=2.0 / (min_delay + max_delay))
+    # One client for the whole batch: with HTTP/2, cheese.com serves all
+    # concurrent requests multiplexed over a single TCP+TLS connection
+    limits = httpx.Limits(max_connections=MAX_CONCURRENCY, keepalive_expiry=60)
+    async with httpx.AsyncClient(http2=True, headers=HEADERS, limits=limits, timeout=30) as client:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+            tasks = [
+                scrape_cheese(client, url, sem, pool, limiter, use_cache=use_cache)
+                for url in urls
+            ]
+            for task in asyncio.as_completed(tasks):
+                cheese = await task
+                if cheese and cheese.get('name'):
+                    writer.write(cheese)
+
+
 def main():
     """Batch scraper main"""
-    
-    # Parse arguments
-    urls = []
-    output_file = None
-    min_delay = 1.5
-    max_delay = 2.5
-    
-    i = 1
-    while i < len(sys.argv):
-        arg = sys.argv[i]
-        
-        if arg == '--file' or arg == '-f':
-            if i + 1 >= len(sys.argv):
-                print("Error: --file requires a filename", file=sys.stderr)
-                sys.exit(1)
-            with open(sys.argv[i + 1]) as f:
-                urls.extend([line.strip() for line in f if line.strip() and not line.startswith('#')])
-            i += 2
-        elif arg == '--output' or arg == '-o':
-            if i + 1 >= len(sys.argv):
-                print("Error: --output requires a filename", file=sys.stderr)
-                sys.exit(1)
-            output_file = sys.argv[i + 1]
-            i += 2
-        elif arg == '--delay' or arg == '-d':
-            if i + 1 >= len(sys.argv):
-                print("Error: --delay requires a number (in seconds)", file=sys.stderr)
-                sys.exit(1)
-            try:
-                delay_value = float(sys.argv[i + 1])
-                min_delay = delay_value
-                max_delay = delay_value + 1.0  # Add 1 second variance
-            except ValueError:
-                print("Error: --delay must be a number", file=sys.stderr)
-                sys.exit(1)
-            i += 2
-        elif arg.startswith('http'):
-            urls.append(arg)
-            i += 1
-        else:
-            i += 1
-    
+
+    parser = argparse.ArgumentParser(
+        description='Scrape multiple cheeses from cheese.com',
+        epilog='Example: python3 batch_scrape.py --file cheese_urls_A.txt --output cheeses.json')
+    parser.add_argument('urls', nargs='*', metavar='url',
+                        help='cheese.com URLs to scrape')
+    parser.add_argument('--file', '-f', action='append', default=[], metavar='FILE',
+                        help='read URLs from file (one per line); may be repeated')
+    parser.add_argument('--output', '-o',
+                        help='save output to file (.jsonl streams JSON Lines)')
+    parser.add_argument('--delay', '-d', type=float, metavar='SECONDS',
+                        help='delay between requests (default: 1.5-2.5s)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='always re-download, ignoring cached pages')
+    # parse_intermixed_args so URLs may appear on either side of options,
+    # as the old hand-rolled parser allowed
+    args = parser.parse_intermixed_args()
+
+    urls = list(args.urls)
+    for url_file in args.file:
+        lines = Path(url_file).read_text().splitlines()
+        urls.extend(line.strip() for line in lines if line.strip() and not line.startswith('#'))
+
     if not urls:
-        print("Usage: python3 batch_scrape.py [--output FILE] [--delay SECONDS] <url1> <url2> ...")
-        print("   or: python3 batch_scrape.py --file urls.txt [--output FILE] [--delay SECONDS]")
-        print("\nOptions:")
-        print("  --file, -f FILE      Read URLs from file (one per line)")
-        print("  --output, -o FILE    Save output to file")
-        print("  --delay, -d SECONDS  Set delay between requests (default: 1.5-2.5s)")
-        print("\nExample:")
-        print("  python3 batch_scrape.py https://www.cheese.com/brie/ https://www.cheese.com/cheddar/")
-        print("  python3 batch_scrape.py --file cheese_urls_A.txt --output cheeses.json")
-        print("  python3 batch_scrape.py --file urls.txt --delay 3.0  # Use 3-4 second delays")
-        sys.exit(1)
-    
+        parser.error('no URLs given (pass them as arguments or via --file)')
+
+    if args.delay is not None:
+        min_delay = args.delay
+        max_delay = args.delay + 1.0  # Add 1 second variance
+    else:
+        min_delay = 1.5
+        max_delay = 2.5
+
+    output_file = args.output
+    use_cache = not args.no_cache
+
     # Scrape all cheeses
-    cheeses = []
     total = len(urls)
-    
-    print(f"Scraping {total} cheeses...", file=sys.stderr)
+
+    print(f"Scraping {total} cheeses ({MAX_CONCURRENCY} concurrent)...", file=sys.stderr)
     print(f"Using {min_delay:.1f}-{max_delay:.1f} second delays to be respectful to the server", file=sys.stderr)
     print()
-    
-    for i, url in enumerate(urls, 1):
-        print(f"[{i}/{total}] {url}", file=sys.stderr)
-        
-        cheese = scrape_cheese(url)
-        if cheese and cheese.get('name'):
-            cheeses.append(cheese)
-            print(f"  ✓ {cheese['name']}", file=sys.stderr)
-        else:
-            print(f"  ✗ Failed or incomplete data", file=sys.stderr)
-        
-        # Be polite - wait between requests with randomization
-        if i < total:
-            delay = random.uniform(min_delay, max_delay)
-            print(f"  ⏳ Waiting {delay:.1f}s...", file=sys.stderr)
-            time.sleep(delay)
-    
+
+    writer = ResultWriter(output_file)
+    try:
+        asyncio.run(main_async(urls, min_delay, max_delay, writer, use_cache=use_cache))
+    finally:
+        writer.close()
+
     # Output results
-    print(f"\nSuccessfully scraped {len(cheeses)}/{total} cheeses", file=sys.stderr)
-    
+    print(f"\nSuccessfully scraped {writer.count}/{total} cheeses", file=sys.stderr)
     if output_file:
-        with open(output_file, 'w') as f:
-            json.dump(cheeses, f, indent=2)
         print(f"Saved to {output_file}", file=sys.stderr)
-    else:
-        print(json.dumps(cheeses, indent=2))
 
 
 if __name__ == "__main__":